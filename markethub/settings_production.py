@@ -1,20 +1,45 @@
 import os
 import dj_database_url
 from pathlib import Path
-from decouple import config
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
+HOMEPAGE_DIR = BASE_DIR / 'homepage'
+
+
+def _load_env_file(path):
+    """Copy KEY=VALUE pairs from a .env file into os.environ, once.
+
+    Variables already set in the real environment take precedence.
+    """
+    if not path.is_file():
+        return
+    for line in path.read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        key, value = line.split('=', 1)
+        os.environ.setdefault(key.strip(), value.strip().strip('\'"'))
+
+
+def _env_bool(name, default=False):
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+_load_env_file(BASE_DIR / '.env')
 
 # Security Settings
-SECRET_KEY = config('SECRET_KEY', default='django-insecure-change-me-in-production')
-DEBUG = config('DEBUG', default=False, cast=bool)
+SECRET_KEY = os.environ.get('SECRET_KEY', 'django-insecure-change-me-in-production')
+DEBUG = _env_bool('DEBUG')
 
 # Hosts configuration for Render
-ALLOWED_HOSTS = config('ALLOWED_HOSTS', default='.onrender.com').split(',')
+ALLOWED_HOSTS = os.environ.get('ALLOWED_HOSTS', '.onrender.com').split(',')
 
 # Application definition
-INSTALLED_APPS = [
+INSTALLED_APPS = (
     'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
@@ -30,9 +55,9 @@ INSTALLED_APPS = [
     'homepage',
     'profiles',
     'student_rewards',
-]
+)
 
-MIDDLEWARE = [
+MIDDLEWARE = (
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -45,14 +70,14 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'csp.middleware.CSPMiddleware',
-]
+)
 
 ROOT_URLCONF = 'markethub.urls'
 
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
-        'DIRS': [BASE_DIR / 'homepage' / 'templates'],
+        'DIRS': [HOMEPAGE_DIR / 'templates'],
         'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
@@ -74,7 +99,7 @@ WSGI_APPLICATION = 'markethub.wsgi.application'
 # Database Configuration for Render (PostgreSQL)
 DATABASES = {
     'default': dj_database_url.config(
-        default=config('DATABASE_URL'),
+        default=os.environ['DATABASE_URL'],
         conn_max_age=600,
         conn_health_checks=True,
     )
@@ -103,12 +128,12 @@ USE_I18N = True
 USE_TZ = True
 
 # Static files (CSS, JavaScript, Images)
-STATIC_URL = config('STATIC_URL', default='/static/')
-STATIC_ROOT = config('STATIC_ROOT', default=str(BASE_DIR / 'staticfiles'))
+STATIC_URL = os.environ.get('STATIC_URL', '/static/')
+STATIC_ROOT = os.environ.get('STATIC_ROOT', str(BASE_DIR / 'staticfiles'))
 
 # Additional directories for static files
 STATICFILES_DIRS = [
-    BASE_DIR / 'homepage' / 'static',
+    HOMEPAGE_DIR / 'static',
 ]
 
 # Whitenoise configuration for static files
@@ -136,9 +161,9 @@ REST_FRAMEWORK = {
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
+    # JSON only in production; the browsable API stays a development tool
     'DEFAULT_RENDERER_CLASSES': [
         'rest_framework.renderers.JSONRenderer',
-        'rest_framework.renderers.BrowsableAPIRenderer',
     ],
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
 }
@@ -153,13 +178,13 @@ SPECTACULAR_SETTINGS = {
 }
 
 # Email Configuration - Use environment variable
-EMAIL_BACKEND = config(
-    'EMAIL_BACKEND', 
-    default='django.core.mail.backends.console.EmailBackend'
+EMAIL_BACKEND = os.environ.get(
+    'EMAIL_BACKEND',
+    'django.core.mail.backends.console.EmailBackend'
 )
 
 # Cache Configuration - Redis for production
-redis_url = config('REDIS_URL', default=None)
+redis_url = os.environ.get('REDIS_URL')
 if redis_url:
     CACHES = {
         'default': {
@@ -171,11 +196,12 @@ if redis_url:
         }
     }
 else:
-    # Fallback to local memory cache
+    # Fallback to a file cache shared by all gunicorn workers on the host
+    # (LocMemCache would keep a separate copy per worker process)
     CACHES = {
         'default': {
-            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-            'LOCATION': 'unique-snowflake',
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.environ.get('CACHE_DIR', str(BASE_DIR / 'cache')),
         }
     }
 
@@ -200,7 +226,7 @@ if not DEBUG:
     X_FRAME_OPTIONS = 'DENY'
 
 # CSRF Protection
-site_url = config('SITE_URL', default='https://markethub.onrender.com')
+site_url = os.environ.get('SITE_URL', 'https://markethub.onrender.com')
 CSRF_TRUSTED_ORIGINS = [site_url]
 
 # CORS Configuration
@@ -256,10 +282,10 @@ AUTHENTICATION_BACKENDS = [
 ]
 
 # Stripe Payment Configuration
-PAYMENT_ENV = config('PAYMENT_ENV', default='test')
-STRIPE_PUBLISHABLE_KEY = config('STRIPE_PUBLISHABLE_KEY', default='')
-STRIPE_SECRET_KEY = config('STRIPE_SECRET_KEY', default='')
-STRIPE_WEBHOOK_SECRET = config('STRIPE_WEBHOOK_SECRET', default='')
+PAYMENT_ENV = os.environ.get('PAYMENT_ENV', 'test')
+STRIPE_PUBLISHABLE_KEY = os.environ.get('STRIPE_PUBLISHABLE_KEY', '')
+STRIPE_SECRET_KEY = os.environ.get('STRIPE_SECRET_KEY', '')
+STRIPE_WEBHOOK_SECRET = os.environ.get('STRIPE_WEBHOOK_SECRET', '')
 
 # API Configuration
 API_BASE_URL = f"{site_url}/api/"
@@ -290,7 +316,7 @@ LOGGING = {
     'loggers': {
         'django': {
             'handlers': ['console'],
-            'level': config('DJANGO_LOG_LEVEL', default='INFO'),
+            'level': os.environ.get('DJANGO_LOG_LEVEL', 'INFO'),
             'propagate': False,
         },
         'markethub': {
@@ -310,5 +336,7 @@ import sys
 if 'markethub.urls' in sys.modules:
     from django.http import HttpResponse
     from django.urls import path
-    
-print("[PRODUCTION SETTINGS] Production settings loaded successfully!")
\ No newline at end of file
+
+# Opt-in load banner; keeps stdout quiet on every worker boot and manage.py call
+if os.environ.get('DJANGO_DEBUG_SETTINGS'):
+    print("[PRODUCTION SETTINGS] Production settings loaded successfully!")
\ No newline at end of file